@@ -19,6 +19,7 @@ from pathlib import Path
 
 from snapshot_tests.transcript import TranscriptEntry, ToolUse, ToolResult, parse_transcript
 from snapshot_tests.commit_tracker import CommitTracker
+from snapshot_tests.simulator import strip_system_reminders
 
 
 def format_tool_use(tool_use: ToolUse) -> list[str]:
@@ -80,21 +81,6 @@ def format_tool_use(tool_use: ToolUse) -> list[str]:
     return lines
 
 
-def strip_system_reminders(content: str) -> str:
-    """Strip <system-reminder> tags and their contents from text."""
-    import re
-
-    # Strip complete system-reminder tags
-    pattern = r"<system-reminder>.*?</system-reminder>"
-    content = re.sub(pattern, "", content, flags=re.DOTALL)
-
-    # Strip truncated system-reminder tags (no closing tag)
-    truncated_pattern = r"<system-reminder>.*$"
-    content = re.sub(truncated_pattern, "", content, flags=re.DOTALL)
-
-    return content.strip()
-
-
 def format_tool_result(
     result: ToolResult,
     tool_name: str | None = None,
@@ -154,8 +140,8 @@ def compile_transcript(
     # Find the project directory from the first user entry
     project_dir = None
     for entry in transcript:
-        if entry.raw.get("cwd"):
-            project_dir = entry.raw["cwd"]
+        if entry.cwd:
+            project_dir = entry.cwd
             break
 
     # Get home directory for substitution
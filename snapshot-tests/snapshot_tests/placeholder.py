@@ -8,11 +8,34 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 # Pattern to match placeholders: <<name>>
 PLACEHOLDER_PATTERN = re.compile(r"<<([^>]+)>>")
 
 
+@lru_cache(maxsize=4096)
+def _compile_expected(expected: str) -> tuple[tuple[str, ...], re.Pattern[str] | None]:
+    """Compile expected text into (placeholder names, match pattern).
+
+    The pattern is None when the text contains no placeholders (exact
+    comparison suffices). Cached because the same expected strings recur
+    across tool calls, so each distinct one is compiled once per run.
+    """
+    placeholders = tuple(PLACEHOLDER_PATTERN.findall(expected))
+    if not placeholders:
+        return placeholders, None
+
+    # Escape regex special characters in the literal text; each placeholder
+    # becomes a non-greedy capturing group
+    parts = PLACEHOLDER_PATTERN.split(expected)
+    pattern = "".join(
+        re.escape(part) if i % 2 == 0 else r"(.+?)"
+        for i, part in enumerate(parts)
+    )
+    return placeholders, re.compile(pattern)
+
+
 @dataclass
 class PlaceholderRegistry:
     """Tracks placeholder -> value mappings during test execution.
@@ -79,17 +102,13 @@ class PlaceholderRegistry:
         Returns:
             True if actual matches expected (with placeholder substitution)
         """
-        # Find all placeholders in expected
-        placeholders = PLACEHOLDER_PATTERN.findall(expected)
+        placeholders, pattern = _compile_expected(expected)
 
-        if not placeholders:
+        if pattern is None:
             # No placeholders, do exact match
             return expected == actual
 
-        # Build a regex pattern from expected, capturing placeholder positions
-        pattern = self._build_match_pattern(expected, placeholders)
-
-        match = re.fullmatch(pattern, actual)
+        match = pattern.fullmatch(actual)
         if not match:
             return False
 
@@ -107,29 +126,6 @@ class PlaceholderRegistry:
 
         return True
 
-    def _build_match_pattern(self, expected: str, placeholders: list[str]) -> str:
-        """Build a regex pattern from expected text with placeholders.
-
-        Each placeholder becomes a capturing group that matches non-greedily.
-        """
-        # Escape regex special characters in the expected text
-        parts = PLACEHOLDER_PATTERN.split(expected)
-
-        pattern_parts = []
-        placeholder_idx = 0
-
-        for i, part in enumerate(parts):
-            if i % 2 == 0:
-                # Regular text - escape it
-                pattern_parts.append(re.escape(part))
-            else:
-                # Placeholder name - create capturing group
-                # Use non-greedy match for flexibility
-                pattern_parts.append(r"(.+?)")
-                placeholder_idx += 1
-
-        return "".join(pattern_parts)
-
     def reset(self) -> None:
         """Clear all stored placeholder values."""
         self.values.clear()
@@ -5,10 +5,21 @@ Provides utilities to install the claude-reliability plugin into test environmen
 
 from __future__ import annotations
 
+import atexit
 import os
 import shutil
+import tempfile
 from pathlib import Path
 
+# One-time staging area holding the assembled .claude payload. Installing the
+# plugin into a test directory then only costs one hardlink per file instead
+# of re-copying the plugin for every test.
+_plugin_staging: Path | None = None
+
+# HOME directories whose global binary cache has already been refreshed this
+# process (isolated test homes each get seeded exactly once).
+_homes_seeded: set[Path] = set()
+
 
 def get_project_root() -> Path:
     """Get the root directory of the claude-reliability project.
@@ -21,70 +32,115 @@ def get_project_root() -> Path:
     return Path(__file__).parent.parent.parent
 
 
-def install_plugin(target_dir: Path, home_dir: Path | None = None) -> None:
-    """Install the claude-reliability plugin into a test directory.
+def _stage_plugin() -> Path:
+    """Assemble the .claude plugin payload once into a staging directory.
 
-    This sets up the plugin structure so that Claude Code will recognize
-    and use the claude-reliability hooks.
+    The staging directory is treated as read-only source material: installs
+    hardlink files out of it rather than copying the plugin per test.
 
-    Args:
-        target_dir: The test directory to install the plugin into
-        home_dir: Optional HOME directory (for isolated tests). If provided,
-                  the binary is also copied to $HOME/.claude-reliability/bin/
-                  where ensure-binary.sh expects to find it.
+    Returns:
+        Path to the staged .claude directory
     """
-    project_root = get_project_root()
-
-    # Create .claude directory structure
-    claude_dir = target_dir / ".claude"
-    claude_dir.mkdir(parents=True, exist_ok=True)
+    global _plugin_staging
+    if _plugin_staging is not None:
+        return _plugin_staging
 
-    # Create plugins directory
-    plugins_dir = claude_dir / "plugins"
-    plugins_dir.mkdir(exist_ok=True)
+    project_root = get_project_root()
+    staging_root = Path(tempfile.mkdtemp(prefix="snapshot-plugin-"))
+    atexit.register(shutil.rmtree, staging_root, True)
 
-    # Create the plugin directory
-    plugin_dir = plugins_dir / "claude-reliability"
-    plugin_dir.mkdir(exist_ok=True)
+    claude_dir = staging_root / ".claude"
+    plugin_dir = claude_dir / "plugins" / "claude-reliability"
+    plugin_dir.mkdir(parents=True)
 
     # Copy plugin.json
     plugin_json_src = project_root / ".claude-plugin" / "plugin.json"
     if plugin_json_src.exists():
         shutil.copy(plugin_json_src, plugin_dir / "plugin.json")
 
-    # Copy scripts directory (preserving structure)
-    scripts_src = project_root / "scripts"
-    scripts_dst = plugin_dir / "scripts"
-    if scripts_src.exists():
-        if scripts_dst.exists():
-            shutil.rmtree(scripts_dst)
-        shutil.copytree(scripts_src, scripts_dst)
-
-    # Copy commands directory if it exists
-    commands_src = project_root / "commands"
-    commands_dst = plugin_dir / "commands"
-    if commands_src.exists():
-        if commands_dst.exists():
-            shutil.rmtree(commands_dst)
-        shutil.copytree(commands_src, commands_dst)
-
-    # Copy hooks directory (contains hooks.json)
-    hooks_src = project_root / "hooks"
-    hooks_dst = plugin_dir / "hooks"
-    if hooks_src.exists():
-        if hooks_dst.exists():
-            shutil.rmtree(hooks_dst)
-        shutil.copytree(hooks_src, hooks_dst)
+    # Copy scripts, commands, and hooks directories (preserving structure)
+    for subdir in ("scripts", "commands", "hooks"):
+        src = project_root / subdir
+        if src.exists():
+            shutil.copytree(src, plugin_dir / subdir)
 
     # Create bin directory and copy the binary
     bin_dir = claude_dir / "bin"
-    bin_dir.mkdir(exist_ok=True)
+    bin_dir.mkdir()
 
     binary_src = project_root / "target" / "release" / "claude-reliability"
     if binary_src.exists():
-        shutil.copy(binary_src, bin_dir / "claude-reliability")
-        os.chmod(bin_dir / "claude-reliability", 0o755)
+        _link_or_copy(binary_src, bin_dir / "claude-reliability")
+
+    # Create a settings file to enable the plugin
+    settings_path = claude_dir / "settings.local.json"
+    settings_path.write_text('{"enabledPlugins": ["claude-reliability"]}')
+
+    _plugin_staging = claude_dir
+    return claude_dir
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink a file into place, copying when linking isn't possible."""
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device link (EXDEV) or unsupported filesystem
+        shutil.copy(src, dst)
+    os.chmod(dst, 0o755)
+
+
+def _link_tree(src_dir: Path, dst_dir: Path) -> None:
+    """Mirror a directory tree using hardlinks (copy on cross-device link).
 
+    JSON files are always copied rather than linked: settings.local.json
+    (and other config) can be rewritten in place during a test, and a
+    hardlink would let that write reach the shared staging inode - and
+    through it every other test directory. Only the large immutable
+    payloads (the binary, scripts, hooks) share inodes with staging.
+    """
+    for src_root, _dirs, files in os.walk(src_dir):
+        root = Path(src_root)
+        dst_root = dst_dir / root.relative_to(src_dir)
+        dst_root.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            src_file = root / name
+            dst_file = dst_root / name
+            if dst_file.exists():
+                continue
+            if name.endswith(".json"):
+                shutil.copy2(src_file, dst_file)
+                continue
+            try:
+                os.link(src_file, dst_file)
+            except OSError:
+                # Cross-device link (EXDEV) or unsupported filesystem
+                shutil.copy2(src_file, dst_file)
+
+
+def install_plugin(target_dir: Path, home_dir: Path | None = None) -> None:
+    """Install the claude-reliability plugin into a test directory.
+
+    This sets up the plugin structure so that Claude Code will recognize
+    and use the claude-reliability hooks. The plugin payload is staged once
+    per process and hardlinked into each test directory.
+
+    Args:
+        target_dir: The test directory to install the plugin into
+        home_dir: Optional HOME directory (for isolated tests). If provided,
+                  the binary is also copied to $HOME/.claude-reliability/bin/
+                  where ensure-binary.sh expects to find it.
+    """
+    staging = _stage_plugin()
+
+    # Mirror the staged .claude payload into the test directory
+    claude_dir = target_dir / ".claude"
+    _link_tree(staging, claude_dir)
+
+    binary_src = claude_dir / "bin" / "claude-reliability"
+    if binary_src.exists():
         # Also copy to the global cache location for legacy compatibility.
         # Note: ensure-binary.sh actually looks in .claude-reliability/bin/
         # (project-local), but this global copy ensures tests work even if
@@ -93,21 +149,13 @@ def install_plugin(target_dir: Path, home_dir: Path | None = None) -> None:
         global_cache_dir = effective_home / ".claude-reliability" / "bin"
         global_cache_dir.mkdir(parents=True, exist_ok=True)
         global_binary = global_cache_dir / "claude-reliability"
-        shutil.copy(binary_src, global_binary)
-        os.chmod(global_binary, 0o755)
-
-    # Update the plugin.json to point to the local scripts
-    # The scripts use ${CLAUDE_PLUGIN_ROOT} which should resolve correctly
-    # when the plugin is in .claude/plugins/claude-reliability/
-
-    # Create a settings file to enable the plugin
-    settings_dir = claude_dir / "settings.local.json"
-    if not settings_dir.exists():
-        settings_dir.write_text('{"enabledPlugins": ["claude-reliability"]}')
+        if effective_home not in _homes_seeded:
+            _link_or_copy(binary_src, global_binary)
+            _homes_seeded.add(effective_home)
 
     # Run ensure-gitignore to create .gitignore entries
     # This is normally done by the session-start hook, but during replay no hooks run
-    binary_path = bin_dir / "claude-reliability"
+    binary_path = claude_dir / "bin" / "claude-reliability"
     if binary_path.exists():
         import subprocess
         subprocess.run(
@@ -131,8 +179,7 @@ def install_plugin_binary_only(target_dir: Path) -> None:
     bin_dir = target_dir / ".claude" / "bin"
     bin_dir.mkdir(parents=True, exist_ok=True)
 
-    # Copy the binary
+    # Link the binary into place (copy if hardlinks aren't possible)
     binary_src = project_root / "target" / "release" / "claude-reliability"
     if binary_src.exists():
-        shutil.copy(binary_src, bin_dir / "claude-reliability")
-        os.chmod(bin_dir / "claude-reliability", 0o755)
+        _link_or_copy(binary_src, bin_dir / "claude-reliability")
@@ -22,8 +22,10 @@ Each test is a directory under tests/ containing:
 from __future__ import annotations
 
 import argparse
+import atexit
 import hashlib
 import json
+import multiprocessing
 import os
 import re
 import shutil
@@ -31,6 +33,8 @@ import subprocess
 import sys
 import tempfile
 import uuid
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -38,13 +42,39 @@ from typing import Any
 from enum import Enum, auto
 
 from snapshot_tests.placeholder import PlaceholderRegistry
-from snapshot_tests.transcript import parse_transcript, extract_tool_calls, get_project_directory
+from snapshot_tests.transcript import (
+    extract_tool_calls,
+    get_project_directory,
+    parse_transcript_cached,
+)
 from snapshot_tests.simulator import ToolSimulator
 from snapshot_tests.compile_transcript import compile_transcript
 from snapshot_tests.plugin_setup import install_plugin
 from snapshot_tests.pty_runner import run_claude_pty
 
 
+# Lazily-imported yaml module (only needed when a test has a config.yaml).
+# Cached at module scope so repeated tests don't pay the per-`import` overhead.
+_yaml: Any = None
+
+
+def _get_yaml() -> Any:
+    """Import and cache the yaml module on first use."""
+    global _yaml
+    if _yaml is None:
+        import yaml
+
+        _yaml = yaml
+    return _yaml
+
+
+def _load_yaml_config(text: str) -> Any:
+    """Parse YAML using the C loader when available (much faster than pure Python)."""
+    yaml = _get_yaml()
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(text, Loader=loader)
+
+
 class ErrorCategory(Enum):
     """Categories of test failures with associated remediation actions."""
 
@@ -222,6 +252,29 @@ class TestResult:
     post_condition_output: str = ""
 
 
+# Suggestion templates per error category, formatted with the failing test's
+# name. A dict lookup avoids re-evaluating the if/elif chain per failure.
+_ERROR_SUGGESTIONS: dict[ErrorCategory, str] = {
+    ErrorCategory.NO_TRANSCRIPT: "  -> Run: just snapshot-tests-record {test_name}",
+    ErrorCategory.DIRECTORY_MISMATCH: (
+        "  -> If changes are expected, review them and run:\n"
+        "     just snapshot-tests --save-snapshot {test_name}"
+    ),
+    ErrorCategory.EXECUTION_ERROR: (
+        "  -> The recorded tool call could not be replayed. This may indicate:\n"
+        "     - Test setup.py doesn't match original environment\n"
+        "     - Files referenced in transcript are missing\n"
+        "     Consider re-recording: just snapshot-tests-record {test_name}"
+    ),
+    ErrorCategory.POST_CONDITION_FAILED: "  -> Check the post-condition.py script for your test",
+    ErrorCategory.RECORDING_FAILED: (
+        "  -> Claude Code failed during recording. Check:\n"
+        "     - Claude Code is installed and authenticated\n"
+        "     - The test prompt in story.md is valid"
+    ),
+}
+
+
 def get_suggestion_for_error(category: ErrorCategory | None, test_name: str) -> str | None:
     """Get an actionable suggestion based on error category.
 
@@ -232,29 +285,42 @@ def get_suggestion_for_error(category: ErrorCategory | None, test_name: str) ->
     Returns:
         A helpful suggestion string, or None if no specific suggestion
     """
-    if category == ErrorCategory.NO_TRANSCRIPT:
-        return f"  -> Run: just snapshot-tests-record {test_name}"
-    elif category == ErrorCategory.DIRECTORY_MISMATCH:
-        return (
-            "  -> If changes are expected, review them and run:\n"
-            f"     just snapshot-tests --save-snapshot {test_name}"
-        )
-    elif category == ErrorCategory.EXECUTION_ERROR:
-        return (
-            "  -> The recorded tool call could not be replayed. This may indicate:\n"
-            "     - Test setup.py doesn't match original environment\n"
-            "     - Files referenced in transcript are missing\n"
-            f"     Consider re-recording: just snapshot-tests-record {test_name}"
-        )
-    elif category == ErrorCategory.POST_CONDITION_FAILED:
-        return "  -> Check the post-condition.py script for your test"
-    elif category == ErrorCategory.RECORDING_FAILED:
-        return (
-            "  -> Claude Code failed during recording. Check:\n"
-            "     - Claude Code is installed and authenticated\n"
-            "     - The test prompt in story.md is valid"
-        )
-    return None
+    if category is None:
+        return None
+    template = _ERROR_SUGGESTIONS.get(category)
+    if template is None:
+        return None
+    return template.format(test_name=test_name)
+
+
+# Per-category summary output for main(): (category, header, action header,
+# optional command template formatted with the space-joined test names).
+CATEGORY_SUMMARIES: list[tuple[ErrorCategory, str, str, str | None]] = [
+    (
+        ErrorCategory.NO_TRANSCRIPT,
+        "Missing transcripts",
+        "Record transcripts with:",
+        "just snapshot-tests-record {names}",
+    ),
+    (
+        ErrorCategory.DIRECTORY_MISMATCH,
+        "Directory snapshot mismatches",
+        "After reviewing the changes, save new snapshots with:",
+        "just snapshot-tests --save-snapshot {names}",
+    ),
+    (
+        ErrorCategory.EXECUTION_ERROR,
+        "Execution errors",
+        "Re-record transcripts with:",
+        "just snapshot-tests-record {names}",
+    ),
+    (
+        ErrorCategory.POST_CONDITION_FAILED,
+        "Post-condition failures",
+        "Check the post-condition.py scripts for these tests",
+        None,
+    ),
+]
 
 
 def find_tests(tests_dir: Path, selected: list[str] | None = None) -> list[TestConfig]:
@@ -269,39 +335,45 @@ def find_tests(tests_dir: Path, selected: list[str] | None = None) -> list[TestC
     """
     tests = []
 
-    for test_dir in sorted(tests_dir.iterdir()):
-        if not test_dir.is_dir():
-            continue
+    # scandir reuses the directory entries' cached file type, and listing
+    # each test's children once replaces the per-file exists() stat calls
+    with os.scandir(tests_dir) as it:
+        candidates = sorted(
+            (entry for entry in it if entry.is_dir(follow_symlinks=False)),
+            key=lambda entry: entry.name,
+        )
 
-        name = test_dir.name
+    for entry in candidates:
+        name = entry.name
         if selected and name not in selected:
             continue
 
+        test_dir = Path(entry.path)
+        children = set(os.listdir(entry.path))
+
         # Check for required setup script
-        setup_script = test_dir / "setup.py"
-        if not setup_script.exists():
-            # Try shell script fallback
+        if "setup.py" in children:
+            setup_script = test_dir / "setup.py"
+        elif "setup.sh" in children:
+            # Shell script fallback
             setup_script = test_dir / "setup.sh"
-            if not setup_script.exists():
-                continue
+        else:
+            continue
 
         # Check for transcript
-        transcript_path = test_dir / "transcript.jsonl"
-        if not transcript_path.exists():
-            transcript_path = None
+        transcript_path = None
+        if "transcript.jsonl" in children:
+            transcript_path = test_dir / "transcript.jsonl"
 
         # Check for post-condition
-        post_condition = test_dir / "post-condition.py"
-        if not post_condition.exists():
-            post_condition = None
+        post_condition = None
+        if "post-condition.py" in children:
+            post_condition = test_dir / "post-condition.py"
 
         # Load config if present
         config = {}
-        config_path = test_dir / "config.yaml"
-        if config_path.exists():
-            import yaml
-
-            config = yaml.safe_load(config_path.read_text()) or {}
+        if "config.yaml" in children:
+            config = _load_yaml_config((test_dir / "config.yaml").read_text()) or {}
 
         tests.append(
             TestConfig(
@@ -317,31 +389,56 @@ def find_tests(tests_dir: Path, selected: list[str] | None = None) -> list[TestC
     return tests
 
 
-def create_virtualenv(temp_dir: Path) -> Path:
-    """Create a virtualenv for the test using uv.
+def start_virtualenv_creation(temp_dir: Path) -> tuple[Path, subprocess.Popen]:
+    """Start creating a virtualenv for the test using uv.
 
     The venv is created OUTSIDE the test directory (as a sibling) so that
     glob operations in the test directory won't find .venv files.
 
+    Creation runs in the background so it can overlap with plugin install;
+    call wait_for_virtualenv() before using the venv.
+
     Args:
         temp_dir: Temporary directory for test
 
     Returns:
-        Path to the virtualenv directory
+        Tuple of (venv directory, running uv process)
     """
     # Create venv as a sibling to the test directory, not inside it
     # This prevents globs from finding .venv files
     venv_dir = temp_dir.parent / f"{temp_dir.name}_venv"
 
     # Create virtualenv with uv, including pip
-    subprocess.run(
+    proc = subprocess.Popen(
         ["uv", "venv", str(venv_dir), "--seed"],
-        check=True,
         cwd=temp_dir,
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
     )
 
-    return venv_dir
+    return venv_dir, proc
+
+
+def wait_for_virtualenv(proc: subprocess.Popen) -> None:
+    """Wait for a backgrounded uv venv process, raising if it failed.
+
+    Args:
+        proc: Process returned by start_virtualenv_creation
+    """
+    stdout, stderr = proc.communicate()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(
+            proc.returncode, proc.args, output=stdout, stderr=stderr
+        )
+
+
+# Base environment for venv subprocesses, computed once at import time.
+# PYTHONHOME is dropped here since it can interfere with venvs; per-venv
+# entries are splatted on top in get_venv_env.
+_BASE_ENV: dict[str, str] = {k: v for k, v in os.environ.items() if k != "PYTHONHOME"}
+_BASE_PATH: str = _BASE_ENV.get("PATH", "")
+_ORIGINAL_HOME: str = _BASE_ENV.get("HOME", "")
 
 
 def get_venv_env(venv_dir: Path, home_dir: Path | None = None) -> dict[str, str]:
@@ -354,22 +451,18 @@ def get_venv_env(venv_dir: Path, home_dir: Path | None = None) -> dict[str, str]
     Returns:
         Environment dict with PATH, VIRTUAL_ENV, and optionally HOME set
     """
-    env = os.environ.copy()
-    venv_bin = venv_dir / "bin"
-    env["PATH"] = f"{venv_bin}:{env.get('PATH', '')}"
-    env["VIRTUAL_ENV"] = str(venv_dir)
-    # Remove PYTHONHOME if set, as it can interfere with venv
-    env.pop("PYTHONHOME", None)
+    env = {
+        **_BASE_ENV,
+        "PATH": f"{venv_dir / 'bin'}:{_BASE_PATH}",
+        "VIRTUAL_ENV": str(venv_dir),
+    }
     # Isolate HOME to prevent test instances from sharing state
     if home_dir:
         # Preserve Rust toolchain access before changing HOME
         # rustup/cargo look for config in $HOME/.rustup and $HOME/.cargo
-        original_home = env.get("HOME", "")
-        if original_home:
-            if "RUSTUP_HOME" not in env:
-                env["RUSTUP_HOME"] = f"{original_home}/.rustup"
-            if "CARGO_HOME" not in env:
-                env["CARGO_HOME"] = f"{original_home}/.cargo"
+        if _ORIGINAL_HOME:
+            env.setdefault("RUSTUP_HOME", f"{_ORIGINAL_HOME}/.rustup")
+            env.setdefault("CARGO_HOME", f"{_ORIGINAL_HOME}/.cargo")
         env["HOME"] = str(home_dir)
     return env
 
@@ -395,8 +488,8 @@ def setup_test_environment(
     temp_dir: Path,
     test: TestConfig,
     project_dir: Path,
-    venv_dir: Path,
-    home_dir: Path,
+    env: dict[str, str],
+    venv_proc: subprocess.Popen | None = None,
 ) -> None:
     """Set up the test environment in a temp directory.
 
@@ -404,22 +497,29 @@ def setup_test_environment(
         temp_dir: Temporary directory for test
         test: Test configuration
         project_dir: Project root directory
-        venv_dir: Path to the virtualenv directory
-        home_dir: Isolated HOME directory for test isolation
+        env: Virtualenv environment (from get_venv_env, computed once per test)
+        venv_proc: Optional in-flight uv venv process; awaited before the
+            setup script runs so plugin install overlaps venv creation
     """
-    os.chdir(temp_dir)
+    # No os.chdir here: process cwd is global state, and every subprocess below
+    # (and in replay/record) already receives cwd=temp_dir explicitly. Keeping
+    # the process cwd untouched is what makes running tests in parallel safe.
 
-    # Install the claude-reliability plugin
+    # Install the claude-reliability plugin while uv venv runs in the background
     # Pass home_dir so the binary is copied to the right location for ensure-binary.sh
     install_plugin(temp_dir, home_dir=None)  # Use real HOME for now to avoid auth issues
 
-    # Get virtualenv environment with isolated HOME
-    env = get_venv_env(venv_dir, home_dir)
+    # The setup script needs the venv on PATH, so wait for creation to finish
+    if venv_proc is not None:
+        wait_for_virtualenv(venv_proc)
 
-    # Run setup script - this handles git init if needed
+    # Run setup script - this handles git init if needed. This stays a
+    # subprocess (not runpy in-process): the script's own child processes
+    # (uv, pip, git) must inherit the venv PATH and isolated HOME from env,
+    # which in-process execution would not provide. -B skips pyc writing.
     if test.setup_script.suffix == ".py":
         subprocess.run(
-            ["python", str(test.setup_script)],
+            ["python", "-B", str(test.setup_script)],
             check=True,
             cwd=temp_dir,
             env=env,
@@ -433,12 +533,29 @@ def setup_test_environment(
         )
 
 
+# Per-process ToolSimulator, reused across tests. Short transcripts spend a
+# noticeable fraction of replay time on simulator/registry construction, so
+# construct once and reset() between tests instead.
+_simulator: ToolSimulator | None = None
+
+
+def _get_simulator(temp_dir: Path, path_mappings: dict[str, str]) -> ToolSimulator:
+    """Get the shared simulator, reset for a new test."""
+    global _simulator
+    if _simulator is None:
+        _simulator = ToolSimulator(
+            registry=PlaceholderRegistry(), cwd=temp_dir, path_mappings=path_mappings
+        )
+    else:
+        _simulator.reset(cwd=temp_dir, path_mappings=path_mappings)
+    return _simulator
+
+
 def run_replay(
     temp_dir: Path,
     test: TestConfig,
     project_dir: Path,
-    venv_dir: Path,
-    home_dir: Path,
+    env: dict[str, str],
     verbose: bool = False,
     save_snapshot: bool = False,
 ) -> TestResult:
@@ -450,8 +567,7 @@ def run_replay(
         temp_dir: Temporary directory for test
         test: Test configuration
         project_dir: Project root directory
-        venv_dir: Path to the virtualenv directory
-        home_dir: Isolated HOME directory for test isolation
+        env: Virtualenv environment (from get_venv_env, computed once per test)
         verbose: Show detailed output
 
     Returns:
@@ -466,7 +582,7 @@ def run_replay(
         )
 
     # Parse transcript
-    transcript = parse_transcript(test.transcript_path)
+    transcript = parse_transcript_cached(test.transcript_path)
     tool_calls = extract_tool_calls(transcript)
 
     if verbose:
@@ -481,9 +597,8 @@ def run_replay(
         if verbose:
             print(f"  Path mapping: {original_project_dir} -> {temp_dir}")
 
-    # Set up simulator with path mappings
-    registry = PlaceholderRegistry()
-    simulator = ToolSimulator(registry=registry, cwd=temp_dir, path_mappings=path_mappings)
+    # Set up simulator with path mappings (reusing the per-process instance)
+    simulator = _get_simulator(temp_dir, path_mappings)
 
     # Simulate each tool call
     # Track true errors (execution failures) separately from mismatches (different output)
@@ -557,9 +672,6 @@ def run_replay(
     elif verbose:
         print("  No directory snapshot to compare (use --save-snapshot to create)")
 
-    # Get virtualenv environment with isolated HOME
-    env = get_venv_env(venv_dir, home_dir)
-
     # Run post-condition if present
     post_condition_output = ""
     if test.post_condition:
@@ -567,7 +679,7 @@ def run_replay(
             print("  Running post-condition...")
         try:
             result = subprocess.run(
-                ["python", str(test.post_condition)],
+                ["python", "-B", str(test.post_condition)],
                 check=True,
                 cwd=temp_dir,
                 capture_output=True,
@@ -610,7 +722,42 @@ def _summarize_input(tool_use) -> str:
     elif tool_use.name == "Grep":
         return tool_use.input.get("pattern", "")[:30]
     else:
-        return json.dumps(tool_use.input)[:50]
+        # List the first few keys rather than json.dumps-ing the whole input,
+        # which would serialize arbitrarily large values just to slice 50 chars
+        return f"{{{', '.join(list(tool_use.input)[:3])}}}"[:50]
+
+
+def _claude_project_dir_name(project_path: Path) -> str:
+    """Derive Claude Code's project directory name for a project path.
+
+    Claude stores transcripts under ~/.claude/projects/<name> where <name>
+    is the absolute project path with every non-alphanumeric character
+    replaced by '-' (e.g. /tmp/foo.bar -> -tmp-foo-bar).
+    """
+    return re.sub(r"[^A-Za-z0-9]", "-", str(project_path))
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy file contents without copying permissions.
+
+    Uses os.copy_file_range (in-kernel copy, reflink where the filesystem
+    supports it) and falls back to shutil.copyfile on platforms or
+    filesystems where that isn't available.
+
+    Args:
+        src: Source file
+        dst: Destination file (overwritten)
+    """
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            remaining = os.fstat(s.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except (AttributeError, OSError):
+        shutil.copyfile(src, dst)
 
 
 def extract_prompt_from_story(story_path: Path) -> str | None:
@@ -635,8 +782,7 @@ def run_record(
     temp_dir: Path,
     test: TestConfig,
     project_dir: Path,
-    venv_dir: Path,
-    home_dir: Path,
+    env: dict[str, str],
     verbose: bool = False,
 ) -> TestResult:
     """Run a test in record mode.
@@ -647,8 +793,7 @@ def run_record(
         temp_dir: Temporary directory for test
         test: Test configuration
         project_dir: Project root directory
-        venv_dir: Path to the virtualenv directory
-        home_dir: Isolated HOME directory for test isolation
+        env: Virtualenv environment (from get_venv_env, computed once per test)
         verbose: Show detailed output
 
     Returns:
@@ -711,19 +856,30 @@ def run_record(
     real_home = Path.home()
     claude_projects = real_home / ".claude" / "projects"
 
+    # Fast path: derive the project directory name from temp_dir and stat a
+    # single file. Fall back to scanning every historical project directory
+    # only if the derived name misses (i.e. the naming scheme changed).
+    transcript_file = (
+        claude_projects / _claude_project_dir_name(temp_dir) / f"{session_id}.jsonl"
+    )
+    if not transcript_file.exists():
+        transcript_file = None
+        for project_dir_hash in claude_projects.iterdir():
+            if not project_dir_hash.is_dir():
+                continue
+            candidate = project_dir_hash / f"{session_id}.jsonl"
+            if candidate.exists():
+                transcript_file = candidate
+                break
+
     transcript_found = False
-    for project_dir_hash in claude_projects.iterdir():
-        if not project_dir_hash.is_dir():
-            continue
-        transcript_file = project_dir_hash / f"{session_id}.jsonl"
-        if transcript_file.exists():
-            # Copy transcript to test directory
-            dest_path = test.test_dir / "transcript.jsonl"
-            shutil.copy(transcript_file, dest_path)
-            transcript_found = True
-            if verbose:
-                print(f"  Copied transcript to {dest_path}")
-            break
+    if transcript_file is not None:
+        # Copy transcript to test directory
+        dest_path = test.test_dir / "transcript.jsonl"
+        _fast_copy(transcript_file, dest_path)
+        transcript_found = True
+        if verbose:
+            print(f"  Copied transcript to {dest_path}")
 
     if not transcript_found:
         return TestResult(
@@ -741,9 +897,6 @@ def run_record(
     if verbose:
         print(f"  Saved directory snapshot ({len(snapshot)} files)")
 
-    # Get virtualenv environment with isolated HOME
-    env = get_venv_env(venv_dir, home_dir)
-
     # Run post-condition if present
     post_condition_output = ""
     if test.post_condition:
@@ -751,7 +904,7 @@ def run_record(
             print("  Running post-condition...")
         try:
             result = subprocess.run(
-                ["python", str(test.post_condition)],
+                ["python", "-B", str(test.post_condition)],
                 check=True,
                 cwd=temp_dir,
                 capture_output=True,
@@ -781,6 +934,46 @@ def run_record(
     return TestResult(name=test.name, passed=True, post_condition_output=post_condition_output)
 
 
+# Per-process parent for all test directories. Allocating tests under one
+# run directory makes per-test creation a single mkdir and leaves exactly
+# one tree to sweep up at exit.
+_run_base_dir: Path | None = None
+
+
+def _new_test_dir() -> Path:
+    """Allocate a fresh test directory under the per-process run directory."""
+    global _run_base_dir
+    if _run_base_dir is None:
+        _run_base_dir = Path(tempfile.mkdtemp(prefix="snapshot-run-"))
+        atexit.register(shutil.rmtree, _run_base_dir, True)
+    return Path(tempfile.mkdtemp(prefix="test-", dir=_run_base_dir))
+
+
+# Single background worker that deletes discarded test directories so the
+# foreground never blocks on rmtree. ThreadPoolExecutor joins at interpreter
+# exit, so pending deletions still complete before the process ends.
+_cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot-cleanup")
+
+
+def _discard_tree(path: Path) -> None:
+    """Move a directory aside and delete it on the background cleanup thread.
+
+    The rename makes the path disappear immediately (so reruns can't trip
+    over half-deleted state) while the actual unlinking happens off the
+    critical path.
+
+    Args:
+        path: Directory to delete (may already be gone)
+    """
+    trash = path.with_name(path.name + ".trash")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        # Already gone, or rename not possible - delete in place
+        trash = path
+    _cleanup_executor.submit(shutil.rmtree, trash, True)
+
+
 def run_test(
     test: TestConfig,
     mode: str,
@@ -799,79 +992,118 @@ def run_test(
     Returns:
         TestResult with pass/fail status
     """
-    with tempfile.TemporaryDirectory() as temp_dir_str:
-        temp_dir = Path(temp_dir_str)
-        venv_dir = None
-        home_dir = None
+    temp_dir = _new_test_dir()
+    venv_dir = None
+    home_dir = None
 
-        try:
-            # Create virtualenv for test isolation (outside test dir)
-            venv_dir = create_virtualenv(temp_dir)
-
-            # Create isolated HOME directory for test isolation
-            home_dir = create_isolated_home(temp_dir)
-
-            setup_test_environment(temp_dir, test, project_dir, venv_dir, home_dir)
-
-            if mode == "replay":
-                return run_replay(temp_dir, test, project_dir, venv_dir, home_dir, verbose, save_snapshot)
-            elif mode == "record":
-                return run_record(temp_dir, test, project_dir, venv_dir, home_dir, verbose)
-            else:
-                return TestResult(
-                    name=test.name,
-                    passed=False,
-                    error=f"Unknown mode: {mode}",
-                    error_category=ErrorCategory.OTHER,
-                )
+    try:
+        # Start creating the virtualenv (outside test dir); it finishes
+        # in the background while the plugin install runs
+        venv_dir, venv_proc = start_virtualenv_creation(temp_dir)
+
+        # Create isolated HOME directory for test isolation
+        home_dir = create_isolated_home(temp_dir)
 
-        except Exception as e:
+        # Compute the virtualenv environment once and share it across
+        # setup, replay/record, and post-conditions
+        env = get_venv_env(venv_dir, home_dir)
+
+        setup_test_environment(temp_dir, test, project_dir, env, venv_proc=venv_proc)
+
+        if mode == "replay":
+            return run_replay(temp_dir, test, project_dir, env, verbose, save_snapshot)
+        elif mode == "record":
+            return run_record(temp_dir, test, project_dir, env, verbose)
+        else:
             return TestResult(
                 name=test.name,
                 passed=False,
-                error=str(e),
+                error=f"Unknown mode: {mode}",
                 error_category=ErrorCategory.OTHER,
             )
-        finally:
-            # Clean up directories created outside the temp dir
-            if venv_dir and venv_dir.exists():
-                shutil.rmtree(venv_dir)
-            if home_dir and home_dir.exists():
-                shutil.rmtree(home_dir)
+
+    except Exception as e:
+        return TestResult(
+            name=test.name,
+            passed=False,
+            error=str(e),
+            error_category=ErrorCategory.OTHER,
+        )
+    finally:
+        # Hand all test directories to the background deleter; venv and home
+        # dirs live outside the temp dir so each needs its own discard
+        if venv_dir and venv_dir.exists():
+            _discard_tree(venv_dir)
+        if home_dir and home_dir.exists():
+            _discard_tree(home_dir)
+        _discard_tree(temp_dir)
+
+
+def _compile_one_transcript(test: TestConfig) -> bool:
+    """Compile one test's transcript to markdown.
+
+    Returns:
+        True if a transcript was compiled, False if the test has none
+    """
+    if not test.transcript_path or not test.transcript_path.exists():
+        return False
+
+    # Read post-condition output if available
+    post_condition_output = None
+    output_file = test.test_dir / "post-condition-output.txt"
+    if output_file.exists():
+        post_condition_output = output_file.read_text()
+
+    md_path = test.transcript_path.with_suffix(".md")
+    transcript = parse_transcript_cached(test.transcript_path)
+    markdown = compile_transcript(
+        transcript, verbose=False, post_condition_output=post_condition_output
+    )
+    # Encode once and write the whole document in a single syscall,
+    # avoiding the text-mode codec layer
+    md_path.write_bytes(markdown.encode("utf-8"))
+    return True
 
 
 def compile_all_transcripts(tests: list[TestConfig], verbose: bool = False) -> None:
     """Compile all transcript.jsonl files to transcript.md.
 
+    Transcripts are independent, so the read/parse/write work is spread
+    across a thread pool.
+
     Args:
         tests: List of test configurations
         verbose: Show detailed output
     """
-    compiled = 0
-    for test in tests:
-        if not test.transcript_path or not test.transcript_path.exists():
-            continue
-
-        # Read post-condition output if available
-        post_condition_output = None
-        output_file = test.test_dir / "post-condition-output.txt"
-        if output_file.exists():
-            post_condition_output = output_file.read_text()
+    if not tests:
+        print("Compiled 0 transcripts to markdown")
+        return
 
-        md_path = test.transcript_path.with_suffix(".md")
-        transcript = parse_transcript(test.transcript_path)
-        markdown = compile_transcript(
-            transcript, verbose=False, post_condition_output=post_condition_output
-        )
-        md_path.write_text(markdown)
-        compiled += 1
+    with ThreadPoolExecutor(max_workers=min(32, len(tests))) as executor:
+        compiled_flags = list(executor.map(_compile_one_transcript, tests))
 
-        if verbose:
-            print(f"  Compiled {test.name}/transcript.md")
+    compiled = 0
+    for test, was_compiled in zip(tests, compiled_flags):
+        if was_compiled:
+            compiled += 1
+            if verbose:
+                print(f"  Compiled {test.name}/transcript.md")
 
     print(f"Compiled {compiled} transcripts to markdown")
 
 
+def _report_result(result: TestResult) -> None:
+    """Print the pass/fail line (plus any suggestion) for one test."""
+    if result.passed:
+        print("  PASS")
+    else:
+        print(f"  FAIL: {result.error}")
+        suggestion = get_suggestion_for_error(result.error_category, result.name)
+        if suggestion:
+            print(suggestion)
+    print()
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Run snapshot tests")
@@ -902,6 +1134,12 @@ def main():
         action="store_true",
         help="Save directory snapshot from replay (for bootstrapping)",
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Number of tests to run in parallel (default: CPU count; record mode is always serial)",
+    )
 
     args = parser.parse_args()
 
@@ -926,89 +1164,72 @@ def main():
     print(f"Running {len(tests)} snapshot tests in {args.mode} mode...")
     print()
 
-    # Run tests
-    results: list[TestResult] = []
-    for test in tests:
-        print(f"Test: {test.name}")
-
-        result = run_test(test, args.mode, project_dir, args.verbose, args.save_snapshot)
-        results.append(result)
+    # Run tests. Record mode stays serial (it drives interactive Claude Code
+    # sessions); replay is an embarrassingly parallel subprocess workload.
+    jobs = args.jobs or os.cpu_count() or 1
+    if args.mode == "record" or args.verbose:
+        jobs = 1
+    jobs = min(jobs, len(tests))
 
-        if result.passed:
-            print("  PASS")
-        else:
-            print(f"  FAIL: {result.error}")
-            suggestion = get_suggestion_for_error(result.error_category, result.name)
-            if suggestion:
-                print(suggestion)
-
-        print()
+    results: list[TestResult] = []
+    if jobs <= 1:
+        for test in tests:
+            print(f"Test: {test.name}")
+            result = run_test(test, args.mode, project_dir, args.verbose, args.save_snapshot)
+            results.append(result)
+            _report_result(result)
+    else:
+        # Spawned workers avoid inheriting this process's threads and chdir
+        # state; results are reported in submission order for stable output
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as executor:
+            futures = [
+                executor.submit(
+                    run_test, test, args.mode, project_dir, args.verbose, args.save_snapshot
+                )
+                for test in tests
+            ]
+            for test, future in zip(tests, futures):
+                print(f"Test: {test.name}")
+                result = future.result()
+                results.append(result)
+                _report_result(result)
 
     # Summary
     passed = sum(1 for r in results if r.passed)
     failed = len(results) - passed
 
-    print(f"Results: {passed} passed, {failed} failed")
+    # Build the whole summary as one string so it's emitted in a single write
+    summary_lines = [f"Results: {passed} passed, {failed} failed"]
 
     # Show actionable summary if there are failures
     if failed > 0:
-        print()
-        print("=" * 60)
-        print("FAILED TESTS - SUGGESTED ACTIONS:")
-        print("=" * 60)
+        divider = "=" * 60
+        summary_lines += ["", divider, "FAILED TESTS - SUGGESTED ACTIONS:", divider]
 
-        # Group failures by category for cleaner output
-        failures_by_category: dict[ErrorCategory | None, list[TestResult]] = {}
+        # Group failures by category for cleaner output (single pass)
+        failures_by_category: dict[ErrorCategory | None, list[str]] = defaultdict(list)
         for r in results:
             if not r.passed:
-                cat = r.error_category
-                if cat not in failures_by_category:
-                    failures_by_category[cat] = []
-                failures_by_category[cat].append(r)
-
-        # Show suggestions by category
-        if ErrorCategory.NO_TRANSCRIPT in failures_by_category:
-            tests_list = [r.name for r in failures_by_category[ErrorCategory.NO_TRANSCRIPT]]
-            print()
-            print(f"Missing transcripts ({len(tests_list)} test(s)):")
-            for name in tests_list:
-                print(f"  - {name}")
-            print()
-            print("  Record transcripts with:")
-            print(f"    just snapshot-tests-record {' '.join(tests_list)}")
-
-        if ErrorCategory.DIRECTORY_MISMATCH in failures_by_category:
-            tests_list = [r.name for r in failures_by_category[ErrorCategory.DIRECTORY_MISMATCH]]
-            print()
-            print(f"Directory snapshot mismatches ({len(tests_list)} test(s)):")
-            for name in tests_list:
-                print(f"  - {name}")
-            print()
-            print("  After reviewing the changes, save new snapshots with:")
-            print(f"    just snapshot-tests --save-snapshot {' '.join(tests_list)}")
-
-        if ErrorCategory.EXECUTION_ERROR in failures_by_category:
-            tests_list = [r.name for r in failures_by_category[ErrorCategory.EXECUTION_ERROR]]
-            print()
-            print(f"Execution errors ({len(tests_list)} test(s)):")
-            for name in tests_list:
-                print(f"  - {name}")
-            print()
-            print("  Re-record transcripts with:")
-            print(f"    just snapshot-tests-record {' '.join(tests_list)}")
-
-        if ErrorCategory.POST_CONDITION_FAILED in failures_by_category:
-            tests_list = [r.name for r in failures_by_category[ErrorCategory.POST_CONDITION_FAILED]]
-            print()
-            print(f"Post-condition failures ({len(tests_list)} test(s)):")
-            for name in tests_list:
-                print(f"  - {name}")
-            print()
-            print("  Check the post-condition.py scripts for these tests")
-
-        print()
-    else:
-        print()
+                failures_by_category[r.error_category].append(r.name)
+
+        # Show suggestions by category, table-driven to avoid a block per category
+        for category, header, action_header, action_template in CATEGORY_SUMMARIES:
+            tests_list = failures_by_category.get(category)
+            if not tests_list:
+                continue
+            summary_lines.append("")
+            summary_lines.append(f"{header} ({len(tests_list)} test(s)):")
+            summary_lines.extend(f"  - {name}" for name in tests_list)
+            summary_lines.append("")
+            summary_lines.append(f"  {action_header}")
+            if action_template:
+                summary_lines.append(
+                    f"    {action_template.format(names=' '.join(tests_list))}"
+                )
+
+    summary_lines.append("")
+    print("\n".join(summary_lines))
 
     # Compile transcripts to markdown
     compile_all_transcripts(tests, args.verbose)
@@ -5,10 +5,15 @@ Simulates Bash, Write, Read, Edit, and other tool calls during test replay.
 
 from __future__ import annotations
 
+import glob
 import os
 import re
+import shlex
+import shutil
 import subprocess
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -16,17 +21,39 @@ from snapshot_tests.placeholder import PlaceholderRegistry
 from snapshot_tests.commit_tracker import normalize_for_comparison as normalize_git_commits
 
 
+_REMINDER_OPEN = "<system-reminder>"
+_REMINDER_CLOSE = "</system-reminder>"
+
+
 def strip_system_reminders(text: str) -> str:
     """Remove <system-reminder>...</system-reminder> blocks from text.
 
     Also handles truncated/incomplete system-reminder tags that may appear
     at the end of tool outputs.
     """
-    # Remove complete system-reminder blocks
-    text = re.sub(r"<system-reminder>.*?</system-reminder>", "", text, flags=re.DOTALL)
-    # Remove incomplete/truncated system-reminder tags at end of text
-    text = re.sub(r"<system-reminder>.*$", "", text, flags=re.DOTALL)
-    return text.strip()
+    # The tags are literal, so a str.find scan beats the regex engine and
+    # most outputs bail out on the first probe
+    start = text.find(_REMINDER_OPEN)
+    if start < 0:
+        return text.strip()
+
+    kept = []
+    i = 0
+    while start >= 0:
+        kept.append(text[i:start])
+        end = text.find(_REMINDER_CLOSE, start + len(_REMINDER_OPEN))
+        if end < 0:
+            # Truncated tag with no closing: drop everything from here on
+            i = len(text)
+            break
+        i = end + len(_REMINDER_CLOSE)
+        start = text.find(_REMINDER_OPEN, i)
+    kept.append(text[i:])
+    return "".join(kept).strip()
+
+
+# Lines mentioning infrastructure paths, removed wholesale (newline included)
+_INFRA_LINE_RE = re.compile(r"(?m)^.*(?:\.venv|\.claude).*\n?")
 
 
 def filter_infrastructure_paths(text: str) -> str:
@@ -36,12 +63,42 @@ def filter_infrastructure_paths(text: str) -> str:
     - .venv: virtualenv structure varies
     - .claude: plugin installation varies
     """
-    lines = text.splitlines()
-    filtered = [
-        line for line in lines
-        if ".venv" not in line and ".claude" not in line
-    ]
-    return "\n".join(sorted(filtered))  # Sort for consistent comparison
+    # One C-level regex pass beats splitting and substring-testing each line
+    lines = _INFRA_LINE_RE.sub("", text).splitlines()
+    lines.sort()  # Sort for consistent comparison
+    return "\n".join(lines)
+
+
+# normalize_bash_output substitutions, fused into a single alternation so the
+# text is scanned once instead of once per rule. The doctest rules precede the
+# bare "in N.NNs" rule so they win at shared match positions.
+_FUSED_BASH_RE = re.compile(
+    r'(?P<ls>(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+    r'\s+\d{1,2}\s+\d{1,2}:\d{2})'
+    r'|(?P<iso>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})'
+    r'|(?P<hash>(?:rust_utils|deps/[a-z_]+)-[0-9a-f]{8,16})'
+    r'|(?P<ran>all doctests ran in \d+\.\d+s)'
+    r'|(?P<took>merged doctests compilation took \d+\.\d+s)'
+    r'|(?P<time>in \d+\.\d+s)'
+    r'|(?P<line>\(line \d+\))'
+)
+_FUSED_BASH_REPLACEMENTS = {
+    "ls": "<timestamp>",
+    "iso": "<timestamp>",
+    "ran": "all doctests ran in <time>",
+    "took": "merged doctests compilation took <time>",
+    "time": "in <time>",
+    "line": "(line <n>)",
+}
+
+
+def _replace_bash_match(m: re.Match[str]) -> str:
+    """Dispatch a fused-pattern match to its replacement."""
+    name = m.lastgroup
+    if name == "hash":
+        # Keep the binary name, drop the per-build hash suffix
+        return m.group("hash").rsplit("-", 1)[0] + "-<hash>"
+    return _FUSED_BASH_REPLACEMENTS[name]
 
 
 def normalize_bash_output(text: str) -> str:
@@ -56,81 +113,47 @@ def normalize_bash_output(text: str) -> str:
     - Cargo compilation lines: "Compiling foo" removed (varies based on cached state)
     - Doc test timing: "all doctests ran in X.XXs" -> "all doctests ran in <time>"
     """
-    # Remove "Compiling ..." lines since they depend on whether code was cached
-    text = re.sub(r'^\s*Compiling [^\n]+\n', '', text, flags=re.MULTILINE)
-    # ls -la timestamp: "Jan 20 13:19" or "Jan  1 09:00"
-    text = re.sub(
-        r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}\s+\d{1,2}:\d{2}',
-        '<timestamp>',
-        text
-    )
-    # ISO timestamp in output
-    text = re.sub(
-        r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',
-        '<timestamp>',
-        text
-    )
-    # Cargo compilation/test timing: "in 0.25s" or "in 1.23s"
-    text = re.sub(
-        r'in \d+\.\d+s',
-        'in <time>',
-        text
-    )
-    # Cargo binary hashes in test output paths (varies in length)
-    text = re.sub(
-        r'(rust_utils|deps/[a-z_]+)-[0-9a-f]{8,16}',
-        r'\1-<hash>',
-        text
-    )
-    # Doc test line numbers: "(line 15)" -> "(line <n>)"
-    text = re.sub(
-        r'\(line \d+\)',
-        '(line <n>)',
-        text
-    )
-    # Doc test summary timing: various formats
-    # "all doctests ran in X.XXs; merged doctests compilation took X.XXs"
-    # or just "merged doctests compilation took X.XXs"
-    text = re.sub(
-        r'all doctests ran in \d+\.\d+s',
-        'all doctests ran in <time>',
-        text
-    )
-    text = re.sub(
-        r'merged doctests compilation took \d+\.\d+s',
-        'merged doctests compilation took <time>',
-        text
-    )
+    # Remove "Compiling ..." lines since they depend on whether code was
+    # cached. A splitlines filter avoids the MULTILINE anchor machinery, and
+    # the substring guard skips the split for the usual Compiling-free output.
+    if 'Compiling ' in text:
+        text = ''.join(
+            line
+            for line in text.splitlines(keepends=True)
+            if not line.lstrip().startswith('Compiling ')
+        )
+    # All remaining substitutions (timestamps, cargo timing and hashes,
+    # doctest line numbers and timing) in a single fused pass
+    text = _FUSED_BASH_RE.sub(_replace_bash_match, text)
     # Normalize test result order by sorting test lines
-    # Lines like "test foo::bar ... ok" should be sorted for comparison
-    lines = text.split('\n')
+    # Lines like "test foo::bar ... ok" should be sorted for comparison.
+    # Single pass: partition while remembering where the first test line sat,
+    # then splice the sorted block back in at that point.
     test_lines = []
     other_lines = []
-    for line in lines:
+    first_test_index = -1
+    for line in text.split('\n'):
         if line.strip().startswith('test ') and ' ... ' in line:
+            if first_test_index < 0:
+                first_test_index = len(other_lines)
             test_lines.append(line)
         else:
             other_lines.append(line)
-    # If there are test lines, sort them and reconstruct
     if test_lines:
         test_lines.sort()
-        # Find where test lines start and reconstruct
-        result_lines = []
-        test_inserted = False
-        for line in lines:
-            if line.strip().startswith('test ') and ' ... ' in line:
-                if not test_inserted:
-                    result_lines.extend(test_lines)
-                    test_inserted = True
-            else:
-                result_lines.append(line)
-        text = '\n'.join(result_lines)
+        other_lines[first_test_index:first_test_index] = test_lines
+        text = '\n'.join(other_lines)
     return text
 
 
+@lru_cache(maxsize=8192)
 def normalize_for_comparison(text: str, tool_name: str | None = None) -> str:
     """Normalize text for lenient comparison.
 
+    Results are memoized: expected outputs recur across tool calls and
+    replays, so each distinct (text, tool) pair pays for the regex pipeline
+    once.
+
     - Strips system reminders
     - Strips trailing whitespace from lines
     - Normalizes line endings
@@ -141,28 +164,90 @@ def normalize_for_comparison(text: str, tool_name: str | None = None) -> str:
     Note: Git SHA normalization is handled separately via normalize_git_output()
     which needs both expected and actual to properly canonicalize placeholders.
     """
-    text = strip_system_reminders(text)
-
-    # For glob outputs, filter out infrastructure paths which vary between runs
-    if tool_name == "Glob":
-        text = filter_infrastructure_paths(text)
-
     # For Edit and Write outputs, skip comparison entirely
     # We can't perfectly replicate Claude Code's read-tracking behavior,
     # and the directory snapshot verifies actual file state at the end.
-    # Just mark as executed so comparison always passes.
+    # Just mark as executed so comparison always passes. Checked before any
+    # normalization so the (possibly large) text is never scanned.
     if tool_name == "Edit":
         return "[edit_executed]"
 
     if tool_name == "Write":
         return "[write_executed]"
 
+    text = strip_system_reminders(text)
+
+    # For glob outputs, filter out infrastructure paths which vary between runs
+    if tool_name == "Glob":
+        text = filter_infrastructure_paths(text)
+
     # For Bash outputs, normalize variable content
     if tool_name == "Bash":
         text = normalize_bash_output(text)
 
-    lines = [line.rstrip() for line in text.splitlines()]
-    return "\n".join(lines).strip()
+    # One generator pass: no intermediate list of rstripped lines
+    return "\n".join(line.rstrip() for line in text.splitlines()).strip()
+
+
+# Quick probe for SHA-shaped hex tokens; gates the git commit normalization
+_SHA_PROBE = re.compile(r"\b[0-9a-f]{7,40}\b")
+
+
+# Characters whose presence means a command needs real shell interpretation
+# (pipes, redirects, expansion, globbing, comments, line continuation, ...)
+_SHELL_ONLY_CHARS = frozenset("|&;<>()$`*?[]{}~!#\\\r\n")
+
+
+def _write_text_utf8(path: Path, content: str) -> None:
+    """Write a string to a file as UTF-8 via raw os.write.
+
+    Encodes once and writes directly, skipping the TextIOWrapper layers
+    path.write_text would set up per call.
+    """
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(content.encode("utf-8"))
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=4096)
+def _resolve_path(cwd: str, file_path: str) -> Path:
+    """Resolve a tool file path against a working directory.
+
+    Cached because replays hit the same (cwd, path) pairs repeatedly and
+    Path construction/normalization is comparatively expensive.
+    """
+    path = Path(file_path)
+    if not path.is_absolute():
+        path = Path(cwd) / path
+    return path
+
+
+@lru_cache(maxsize=256)
+def _resolve_executable(name: str) -> str | None:
+    """Locate an executable on PATH, cached per command name."""
+    return shutil.which(name)
+
+
+def _simple_command_tokens(command: str) -> list[str] | None:
+    """Tokenize a command that can run without a shell, or None.
+
+    Commands using shell features (metacharacters, variable assignments,
+    builtins like cd) return None and must go through `sh -c`.
+    """
+    if not command or _SHELL_ONLY_CHARS.intersection(command):
+        return None
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        return None
+    # Leading VAR=value assignments and shell builtins need a real shell
+    if not tokens or "=" in tokens[0] or _resolve_executable(tokens[0]) is None:
+        return None
+    return tokens
 
 
 @dataclass
@@ -196,6 +281,59 @@ class ToolSimulator:
     # This should be reset between conversation turns to match Claude Code behavior
     files_read: set[str] = field(default_factory=set)
 
+    def __post_init__(self) -> None:
+        # Build the tool dispatch table once per simulator instead of on
+        # every simulate() call
+        self._handlers = {
+            "Bash": self._handle_bash,
+            "Write": self._handle_write,
+            "Read": self._handle_read,
+            "Edit": self._handle_edit,
+            "Glob": self._handle_glob,
+            "Grep": self._handle_grep,
+            # Pass-through tools that don't affect file system state
+            "Task": self._handle_passthrough,
+            "TodoWrite": self._handle_passthrough,
+            "Skill": self._handle_passthrough,
+            "AskUserQuestion": self._handle_passthrough,
+        }
+        self._rebuild_path_pattern()
+
+    def _rebuild_path_pattern(self) -> None:
+        """Compile path_mappings into a single alternation regex.
+
+        One compiled scan replaces the per-mapping str.replace passes.
+        Longer paths sort first so a mapping that is a prefix of another
+        keeps the same priority the sequential replaces had.
+        """
+        if self.path_mappings:
+            self._path_pattern = re.compile(
+                "|".join(
+                    re.escape(old)
+                    for old in sorted(self.path_mappings, key=len, reverse=True)
+                )
+            )
+        else:
+            self._path_pattern = None
+
+    def reset(self, cwd: Path | None = None, path_mappings: dict[str, str] | None = None) -> None:
+        """Reset per-test state so one simulator instance can be reused.
+
+        Clears the placeholder registry and read tracking, and reassigns the
+        working directory and path mappings for the next test. Reusing an
+        instance amortizes construction cost across tests.
+
+        Args:
+            cwd: New working directory (kept if None)
+            path_mappings: New path mappings (cleared if None)
+        """
+        if cwd is not None:
+            self.cwd = cwd
+        self.path_mappings = path_mappings or {}
+        self._rebuild_path_pattern()
+        self.registry.reset()
+        self.files_read.clear()
+
     def reset_read_state(self) -> None:
         """Reset the read tracking state.
 
@@ -213,10 +351,11 @@ class ToolSimulator:
         Returns:
             Text with paths substituted
         """
-        result = text
-        for old_path, new_path in self.path_mappings.items():
-            result = result.replace(old_path, new_path)
-        return result
+        if self._path_pattern is None:
+            return text
+        return self._path_pattern.sub(
+            lambda m: self.path_mappings[m.group(0)], text
+        )
 
     def substitute_tool_input(self, tool_input: dict[str, Any]) -> dict[str, Any]:
         """Substitute paths in tool input dictionary.
@@ -236,7 +375,7 @@ class ToolSimulator:
         return result
 
     # Tools that don't affect file system state and should skip comparison
-    PASSTHROUGH_TOOLS = {"Task", "TodoWrite", "Skill", "AskUserQuestion"}
+    PASSTHROUGH_TOOLS = frozenset({"Task", "TodoWrite", "Skill", "AskUserQuestion"})
 
     def simulate(
         self,
@@ -298,20 +437,40 @@ class ToolSimulator:
         # Check against expected if provided
         # Also substitute paths in expected result for comparison
         matched = True
-        if expected_result is not None and success:
+        if expected_result is not None and success and tool_name not in ("Edit", "Write"):
+            # Edit and Write are excluded above: normalize_for_comparison
+            # collapses their output to a constant marker on both sides, so
+            # the comparison always passes and normalizing (potentially large)
+            # outputs is wasted work.
             substituted_expected = self.substitute_paths(expected_result)
-            # Normalize both for lenient comparison, passing tool name for special handling
-            normalized_expected = normalize_for_comparison(substituted_expected, tool_name)
-            normalized_actual = normalize_for_comparison(actual_output, tool_name)
-
-            # For Bash outputs, also normalize git SHAs using commit placeholders
-            if tool_name == "Bash":
-                normalized_expected, normalized_actual = normalize_git_commits(
+            if substituted_expected != actual_output:
+                # Outputs differ verbatim (the lenient path); identical
+                # outputs — the common case in a passing suite — skip
+                # normalization entirely.
+                # Normalize both for lenient comparison, passing tool name
+                # for special handling
+                normalized_expected = normalize_for_comparison(substituted_expected, tool_name)
+                normalized_actual = normalize_for_comparison(actual_output, tool_name)
+
+                # For Bash outputs, also normalize git SHAs using commit
+                # placeholders -- but only when either side actually contains
+                # something SHA-shaped (or an existing <<commit>> placeholder);
+                # most bash output has neither
+                if tool_name == "Bash" and (
+                    "<<commit" in normalized_expected
+                    or _SHA_PROBE.search(normalized_expected)
+                    or _SHA_PROBE.search(normalized_actual)
+                ):
+                    normalized_expected, normalized_actual = normalize_git_commits(
+                        normalized_expected, normalized_actual
+                    )
+
+                # C-level string equality first; identical normalized text is
+                # the common case and needs no placeholder machinery
+                matched = normalized_expected == normalized_actual or self.registry.match(
                     normalized_expected, normalized_actual
                 )
 
-            matched = self.registry.match(normalized_expected, normalized_actual)
-
         return SimulationResult(
             success=success,
             output=actual_output,
@@ -321,20 +480,7 @@ class ToolSimulator:
 
     def _get_handler(self, tool_name: str):
         """Get the handler function for a tool."""
-        handlers = {
-            "Bash": self._handle_bash,
-            "Write": self._handle_write,
-            "Read": self._handle_read,
-            "Edit": self._handle_edit,
-            "Glob": self._handle_glob,
-            "Grep": self._handle_grep,
-            # Pass-through tools that don't affect file system state
-            "Task": self._handle_passthrough,
-            "TodoWrite": self._handle_passthrough,
-            "Skill": self._handle_passthrough,
-            "AskUserQuestion": self._handle_passthrough,
-        }
-        return handlers.get(tool_name)
+        return self._handlers.get(tool_name)
 
     def _handle_bash(self, tool_input: dict[str, Any]) -> str:
         """Execute a bash command."""
@@ -344,10 +490,18 @@ class ToolSimulator:
         if self.dry_run:
             return f"[DRY RUN] Would execute: {command}"
 
+        # Each call gets a fresh shell on purpose: Claude Code runs Bash tool
+        # calls the same way, so a persistent shell would let cwd/env changes
+        # leak between calls and diverge from the recorded session. stdin is
+        # closed so a replayed command can never block waiting for input.
+        # Simple commands (no shell features) are exec'd directly, skipping
+        # the /bin/sh wrapper process.
+        tokens = _simple_command_tokens(command)
         result = subprocess.run(
-            command,
-            shell=True,
+            tokens if tokens is not None else command,
+            shell=tokens is None,
             cwd=self.cwd,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
             timeout=timeout,
@@ -370,9 +524,7 @@ class ToolSimulator:
         if self.dry_run:
             return f"[DRY RUN] Would write {len(content)} bytes to {file_path}"
 
-        path = Path(file_path)
-        if not path.is_absolute():
-            path = self.cwd / path
+        path = _resolve_path(str(self.cwd), file_path)
 
         # Claude Code enforces read-before-write for existing files
         file_exists = path.exists()
@@ -380,7 +532,7 @@ class ToolSimulator:
             return "<tool_use_error>File has not been read yet. Read it first before writing to it.</tool_use_error>"
 
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content)
+        _write_text_utf8(path, content)
 
         if file_exists:
             return f"The file {file_path} has been updated successfully."
@@ -403,9 +555,7 @@ class ToolSimulator:
         offset = tool_input.get("offset", 0)
         limit = tool_input.get("limit", 2000)
 
-        path = Path(file_path)
-        if not path.is_absolute():
-            path = self.cwd / path
+        path = _resolve_path(str(self.cwd), file_path)
 
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
@@ -413,19 +563,38 @@ class ToolSimulator:
         # Track that this file has been read (for read-before-write enforcement)
         self.files_read.add(str(path))
 
-        content = path.read_text(encoding="utf-8")
-        # Use split('\n') to match Claude Code's behavior with trailing newlines
-        lines = content.split('\n')
-
-        # Apply offset and limit
-        selected_lines = lines[offset : offset + limit]
-
-        # Format with line numbers (Claude Code style with arrow separator)
-        result_lines = []
-        for i, line in enumerate(selected_lines, start=offset + 1):
-            result_lines.append(f"{i:>6}→{line}")
-
-        return "\n".join(result_lines)
+        # Stream just the requested window rather than materializing every
+        # line: peak memory is O(limit) and the unread tail is never decoded.
+        # split('\n') semantics are preserved below: a trailing newline (or an
+        # empty file) contributes one final empty line.
+        selected_lines: list[str] = []
+        consumed = 0
+        ends_with_newline = False
+        with path.open("r", encoding="utf-8") as f:
+            for raw_line in islice(f, offset + limit):
+                consumed += 1
+                ends_with_newline = raw_line.endswith("\n")
+                if consumed > offset:
+                    selected_lines.append(
+                        raw_line[:-1] if ends_with_newline else raw_line
+                    )
+            at_eof = f.read(1) == ""
+
+        # The virtual empty line after a trailing newline sits at index
+        # `consumed`; include it when it falls inside the requested window
+        if (
+            at_eof
+            and (consumed == 0 or ends_with_newline)
+            and offset <= consumed < offset + limit
+        ):
+            selected_lines.append("")
+
+        # Format with line numbers (Claude Code style with arrow separator);
+        # join over a generator avoids growing an intermediate list
+        return "\n".join(
+            f"{i:>6}→{line}"
+            for i, line in enumerate(selected_lines, start=offset + 1)
+        )
 
     def _handle_edit(self, tool_input: dict[str, Any]) -> str:
         """Edit a file by replacing text.
@@ -447,9 +616,7 @@ class ToolSimulator:
         if old_string == new_string:
             return "<tool_use_error>old_string and new_string must be different.</tool_use_error>"
 
-        path = Path(file_path)
-        if not path.is_absolute():
-            path = self.cwd / path
+        path = _resolve_path(str(self.cwd), file_path)
 
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
@@ -458,24 +625,34 @@ class ToolSimulator:
         if str(path) not in self.files_read:
             return "<tool_use_error>File has not been read yet. Read it first before writing to it.</tool_use_error>"
 
-        content = path.read_text()
-
-        if old_string not in content:
+        # Raw os.open/os.read skips the BufferedReader/TextIOWrapper layers;
+        # edit targets are consumed whole, so nothing is lost by going direct
+        fd = os.open(str(path), os.O_RDONLY)
+        try:
+            chunks = []
+            while chunk := os.read(fd, 1 << 20):
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+        content = b"".join(chunks).decode("utf-8")
+
+        first = content.find(old_string)
+        if first < 0:
             raise ValueError(f"old_string not found in {file_path}")
 
-        # Check for uniqueness constraint when replace_all is False
-        if not replace_all:
-            match_count = content.count(old_string)
-            if match_count > 1:
-                return f"<tool_use_error>Multiple occurrences of old_string found ({match_count} matches). Use replace_all: true or provide a more unique string.</tool_use_error>"
-
         if replace_all:
             new_content = content.replace(old_string, new_string)
         else:
-            # Replace only first occurrence (already verified uniqueness above)
-            new_content = content.replace(old_string, new_string, 1)
+            # A second find from just past the first match detects the
+            # uniqueness violation without scanning the whole file; the
+            # full count is only computed for the error message
+            second = content.find(old_string, first + len(old_string))
+            if second >= 0:
+                match_count = content.count(old_string)
+                return f"<tool_use_error>Multiple occurrences of old_string found ({match_count} matches). Use replace_all: true or provide a more unique string.</tool_use_error>"
+            new_content = content[:first] + new_string + content[first + len(old_string):]
 
-        path.write_text(new_content)
+        _write_text_utf8(path, new_content)
 
         return f"The file {file_path} has been updated successfully."
 
@@ -484,12 +661,22 @@ class ToolSimulator:
         pattern = tool_input.get("pattern", "")
         search_path = tool_input.get("path", str(self.cwd))
 
-        path = Path(search_path)
-        if not path.is_absolute():
-            path = self.cwd / path
+        path = _resolve_path(str(self.cwd), search_path)
+
+        if "**" not in pattern:
+            # Non-recursive patterns go through the C-backed glob module
+            # (no Path object per entry); include_hidden matches pathlib's
+            # behaviour of not skipping dotfiles
+            matches = glob.glob(
+                os.path.join(str(path), pattern), include_hidden=True
+            )
+            matches.sort()
+            return "\n".join(matches)
 
-        matches = sorted(path.glob(pattern))
-        return "\n".join(str(m) for m in matches)
+        # Recursive ** globs keep pathlib, whose ** semantics (directories
+        # only for a trailing **, zero-or-more components) the recorded
+        # transcripts rely on
+        return "\n".join(str(m) for m in sorted(path.glob(pattern)))
 
     def _handle_passthrough(self, tool_input: dict[str, Any]) -> str:
         """Handle tools that don't affect file system state.
@@ -518,16 +705,21 @@ class ToolSimulator:
             rg_args.append("-c")
         # For "content" mode, default output works
 
+        # head_limit bounds total output lines, so apply it after the run.
+        # --max-count is the wrong tool here: it is a per-file cap, which in
+        # count mode would silently clip the reported counts themselves.
+        head_limit = tool_input.get("head_limit")
+
         rg_args.extend([pattern, search_path])
 
         try:
             result = subprocess.run(
                 rg_args,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 cwd=self.cwd,
             )
-            return result.stdout.rstrip()
         except FileNotFoundError:
             # Fall back to grep
             grep_args = ["grep", "-r"]
@@ -539,11 +731,16 @@ class ToolSimulator:
 
             result = subprocess.run(
                 grep_args,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 cwd=self.cwd,
             )
-            return result.stdout.rstrip()
+
+        output = result.stdout.rstrip()
+        if head_limit:
+            output = "\n".join(output.splitlines()[:head_limit])
+        return output
 
 
 def create_simulator(
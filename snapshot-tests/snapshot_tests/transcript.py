@@ -7,12 +7,27 @@ structured data for replay testing.
 from __future__ import annotations
 
 import json
+import mmap
+import os
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+try:
+    import orjson
 
-@dataclass
+    _json_loads = orjson.loads
+    _JSONDecodeError: type[Exception] = orjson.JSONDecodeError
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+
+@dataclass(slots=True)
 class ToolUse:
     """Represents a tool use from Claude."""
 
@@ -21,7 +36,7 @@ class ToolUse:
     input: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Represents a tool result from execution."""
 
@@ -30,12 +45,43 @@ class ToolResult:
     is_error: bool = False
 
 
-@dataclass
+# Sentinel distinguishing "not computed yet" from a computed None in the
+# ContentBlock caches below. A plain object() would lose identity when the
+# slots dataclasses carrying it are pickled to/from parse_transcripts
+# workers, so the sentinel reduces to its module-global name and unpickles
+# back to this exact singleton.
+class _MissingType:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+    def __reduce__(self) -> str:
+        return "_MISSING"
+
+
+_MISSING: Any = _MissingType()
+
+
+@dataclass(slots=True)
 class ContentBlock:
-    """A content block within a message."""
+    """A content block within a message.
+
+    The block is a thin view over the raw content dict; the type is read
+    from the dict rather than duplicated as a second field.
+    """
 
-    type: str
     data: dict[str, Any]
+    # Parsed views are cached after first access: traversals like
+    # extract_tool_calls touch each block's tool_use/tool_result repeatedly
+    # and reconstructing the dataclass each time is pure allocation churn
+    _tool_use: Any = field(default=_MISSING, repr=False, compare=False)
+    _tool_result: Any = field(default=_MISSING, repr=False, compare=False)
+
+    @property
+    def type(self) -> str:
+        """Get the block type."""
+        return self.data.get("type", "unknown")
 
     @property
     def text(self) -> str | None:
@@ -47,27 +93,33 @@ class ContentBlock:
     @property
     def tool_use(self) -> ToolUse | None:
         """Get tool use if this is a tool_use block."""
-        if self.type == "tool_use":
-            return ToolUse(
-                id=self.data.get("id", ""),
-                name=self.data.get("name", ""),
-                input=self.data.get("input", {}),
-            )
-        return None
+        if self._tool_use is _MISSING:
+            if self.type == "tool_use":
+                self._tool_use = ToolUse(
+                    id=self.data.get("id", ""),
+                    name=self.data.get("name", ""),
+                    input=self.data.get("input", {}),
+                )
+            else:
+                self._tool_use = None
+        return self._tool_use
 
     @property
     def tool_result(self) -> ToolResult | None:
         """Get tool result if this is a tool_result block."""
-        if self.type == "tool_result":
-            return ToolResult(
-                tool_use_id=self.data.get("tool_use_id", ""),
-                content=self.data.get("content", ""),
-                is_error=self.data.get("is_error", False),
-            )
-        return None
-
-
-@dataclass
+        if self._tool_result is _MISSING:
+            if self.type == "tool_result":
+                self._tool_result = ToolResult(
+                    tool_use_id=self.data.get("tool_use_id", ""),
+                    content=self.data.get("content", ""),
+                    is_error=self.data.get("is_error", False),
+                )
+            else:
+                self._tool_result = None
+        return self._tool_result
+
+
+@dataclass(slots=True)
 class TranscriptEntry:
     """A single entry in a Claude Code transcript.
 
@@ -85,41 +137,33 @@ class TranscriptEntry:
     uuid: str
     timestamp: str
     parent_uuid: str | None
+    role: str | None
+    cwd: str | None
     content: list[ContentBlock]
-    raw: dict[str, Any] = field(repr=False)
-
-    @property
-    def role(self) -> str | None:
-        """Get the role if this is a message entry."""
-        message = self.raw.get("message", {})
-        return message.get("role")
+    _text_content: Any = field(default=_MISSING, repr=False, compare=False)
 
     @property
     def text_content(self) -> str:
         """Get concatenated text content from all text blocks."""
-        texts = []
-        for block in self.content:
-            if block.type == "text" and block.text:
-                texts.append(block.text)
-        return "\n".join(texts)
+        if self._text_content is _MISSING:
+            self._text_content = "\n".join(
+                block.text for block in self.content if block.type == "text" and block.text
+            )
+        return self._text_content
 
     @property
-    def tool_uses(self) -> list[ToolUse]:
+    def tool_uses(self) -> tuple[ToolUse, ...]:
         """Get all tool uses from this entry."""
-        uses = []
-        for block in self.content:
-            if tu := block.tool_use:
-                uses.append(tu)
-        return uses
+        if not self.content:
+            return ()
+        return tuple(tu for block in self.content if (tu := block.tool_use))
 
     @property
-    def tool_results(self) -> list[ToolResult]:
+    def tool_results(self) -> tuple[ToolResult, ...]:
         """Get all tool results from this entry."""
-        results = []
-        for block in self.content:
-            if tr := block.tool_result:
-                results.append(tr)
-        return results
+        if not self.content:
+            return ()
+        return tuple(tr for block in self.content if (tr := block.tool_result))
 
 
 def parse_content_blocks(content: Any) -> list[ContentBlock]:
@@ -130,51 +174,88 @@ def parse_content_blocks(content: Any) -> list[ContentBlock]:
     - A list of content block dicts
     """
     if isinstance(content, str):
-        return [ContentBlock(type="text", data={"text": content})]
+        return [ContentBlock(data={"type": "text", "text": content})]
 
     if not isinstance(content, list):
         return []
 
-    blocks = []
+    # Hot per-entry loop: exact type checks (JSON decoding only ever produces
+    # plain dict/str here) and locally bound names keep the interpreter
+    # overhead per item minimal
+    blocks: list[ContentBlock] = []
+    append = blocks.append
+    block = ContentBlock
     for item in content:
-        if isinstance(item, dict):
-            block_type = item.get("type", "unknown")
-            blocks.append(ContentBlock(type=block_type, data=item))
-        elif isinstance(item, str):
-            blocks.append(ContentBlock(type="text", data={"text": item}))
+        t = type(item)
+        if t is dict:
+            b = block(data=item)
+            # Tool blocks get their parsed view built here, while the dict
+            # is already in hand, instead of deferring to the properties:
+            # extract_tool_calls reads every tool block anyway, and this
+            # does the key lookups exactly once per block
+            block_type = item.get("type")
+            if block_type == "tool_use":
+                b._tool_use = ToolUse(
+                    item.get("id", ""),
+                    item.get("name", ""),
+                    item.get("input") or {},
+                )
+            elif block_type == "tool_result":
+                b._tool_result = ToolResult(
+                    item.get("tool_use_id", ""),
+                    item.get("content", ""),
+                    item.get("is_error", False),
+                )
+            append(b)
+        elif t is str:
+            append(block(data={"type": "text", "text": item}))
 
     return blocks
 
 
+# Immutable empty-mapping fallback so missing keys don't allocate a fresh
+# dict on every parsed line
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# File history and progress entries aren't useful for replay testing; hoisted
+# so parse_entry doesn't rebuild the set for every JSONL line
+_SKIP_TYPES: frozenset[str] = frozenset(
+    {"file-history-snapshot", "progress", "hook_progress", "bash_progress"}
+)
+
+
 def parse_entry(data: dict[str, Any]) -> TranscriptEntry | None:
     """Parse a single JSONL line into a TranscriptEntry.
 
     Returns None for entries that aren't useful for replay testing.
     """
-    entry_type = data.get("type")
-    if not entry_type:
+    # Called once per transcript line; bind the dict lookup locally and pass
+    # fields positionally to keep per-call interpreter overhead down
+    get = data.get
+    entry_type = get("type")
+    if not entry_type or entry_type in _SKIP_TYPES:
         return None
 
-    # Skip file history and progress entries
-    skip_types = {"file-history-snapshot", "progress", "hook_progress", "bash_progress"}
-    if entry_type in skip_types:
-        return None
-
-    uuid = data.get("uuid", "")
-    timestamp = data.get("timestamp", "")
-    parent_uuid = data.get("parentUuid")
-
     # Extract content from message if present
-    message = data.get("message", {})
-    content = message.get("content", [])
+    message = get("message") or _EMPTY
+
+    # type and role are drawn from a tiny vocabulary; interning collapses
+    # the per-line copies into one canonical string each, so the equality
+    # checks in downstream loops short-circuit on identity
+    if type(entry_type) is str:
+        entry_type = sys.intern(entry_type)
+    role = message.get("role")
+    if type(role) is str:
+        role = sys.intern(role)
 
     return TranscriptEntry(
-        type=entry_type,
-        uuid=uuid,
-        timestamp=timestamp,
-        parent_uuid=parent_uuid,
-        content=parse_content_blocks(content),
-        raw=data,
+        entry_type,
+        get("uuid", ""),
+        get("timestamp", ""),
+        get("parentUuid"),
+        role,
+        get("cwd"),
+        parse_content_blocks(message.get("content") or ()),
     )
 
 
@@ -187,27 +268,198 @@ def parse_transcript(path: Path) -> list[TranscriptEntry]:
     Returns:
         List of TranscriptEntry objects, filtered to useful entries
     """
-    entries = []
+    entries, _offset = _parse_entries_from(path, 0)
+    return entries
+
+
+def iter_transcript(path: Path) -> Iterator[TranscriptEntry]:
+    """Lazily yield transcript entries without materializing the full list.
+
+    Useful for very large transcripts where the consumer only retains a
+    subset of entries; peak memory stays proportional to what the caller
+    keeps rather than the whole file.
+
+    Args:
+        path: Path to .jsonl transcript file
+
+    Yields:
+        TranscriptEntry objects, filtered to useful entries
+    """
+    with open(path, "rb") as f:
+        yield from _iter_entries(f)
+
 
-    with open(path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
+def _iter_entries(f: Any) -> Iterator[TranscriptEntry]:
+    """Yield parsed entries from an open binary file, starting at its position.
+
+    Memory-maps the file and scans for newlines with mmap.find, so line
+    extraction never copies through Python-level buffers and the kernel
+    handles readahead. Falls back to buffered chunk reads when the file
+    can't be mapped (empty files, pipes).
+    """
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        yield from _iter_entries_buffered(f)
+        return
+
+    with mm:
+        start = f.tell()
+        while (newline := mm.find(b"\n", start)) != -1:
+            line = mm[start:newline].strip()
+            start = newline + 1
             if not line:
                 continue
+            try:
+                data = _json_loads(line)
+            except _JSONDecodeError:
+                # Skip malformed lines
+                continue
+            if entry := parse_entry(data):
+                yield entry
 
+        # Trailing line without a newline terminator
+        line = mm[start:].strip()
+        if line:
             try:
-                data = json.loads(line)
-                if entry := parse_entry(data):
-                    entries.append(entry)
-            except json.JSONDecodeError:
+                data = _json_loads(line)
+            except _JSONDecodeError:
+                data = None
+            if data is not None and (entry := parse_entry(data)):
+                yield entry
+
+        # Keep the file position consistent with how much was consumed, for
+        # callers that record the end offset
+        f.seek(len(mm))
+
+
+def _iter_entries_buffered(f: Any) -> Iterator[TranscriptEntry]:
+    """Chunk-buffered fallback for _iter_entries.
+
+    Decodes fixed-size chunks and splits on newlines directly: one buffer
+    scan per chunk beats a readline call per entry on large transcripts.
+    The partial line at the end of each chunk is carried in a bytearray so
+    extending it is amortized O(1).
+    """
+    buffer = bytearray()
+    while chunk := f.read1(1 << 20):
+        buffer += chunk
+        start = 0
+        while (newline := buffer.find(b"\n", start)) != -1:
+            line = buffer[start:newline].strip()
+            start = newline + 1
+            if not line:
+                continue
+            try:
+                data = _json_loads(line)
+            except _JSONDecodeError:
                 # Skip malformed lines
                 continue
+            if entry := parse_entry(data):
+                yield entry
+        del buffer[:start]
+
+    # Trailing line without a newline terminator
+    line = buffer.strip()
+    if line:
+        try:
+            data = _json_loads(line)
+        except _JSONDecodeError:
+            return
+        if entry := parse_entry(data):
+            yield entry
+
+
+def _parse_entries_from(path: Path, offset: int) -> tuple[list[TranscriptEntry], int]:
+    """Parse transcript entries starting at a byte offset.
+
+    Args:
+        path: Path to .jsonl transcript file
+        offset: Byte offset to start parsing from
+
+    Returns:
+        Tuple of (parsed entries, byte offset after the last line read)
+    """
+    with open(path, "rb") as f:
+        if offset:
+            f.seek(offset)
+        entries = list(_iter_entries(f))
+        end_offset = f.tell()
+
+    return entries, end_offset
+
+
+# Cache of parsed transcripts keyed by path, validated by (size, mtime_ns) and
+# carrying the byte offset already parsed. Transcripts are append-only during
+# recording, so when a file has grown only the new bytes are decoded; replay
+# and markdown compilation of an unchanged file reuse the cached entries.
+_parse_cache: dict[str, tuple[int, int, int, list[TranscriptEntry]]] = {}
+
+
+def parse_transcript_cached(path: Path) -> list[TranscriptEntry]:
+    """Parse a transcript, reusing or incrementally extending cached results.
 
+    Unchanged files return the cached entry list; files that have grown
+    (append-only) are parsed only from the previous end offset. Truncated
+    or rewritten files fall back to a full parse.
+
+    Callers must treat the returned entries as read-only since they are
+    shared across call sites.
+
+    Args:
+        path: Path to .jsonl transcript file
+
+    Returns:
+        List of TranscriptEntry objects, filtered to useful entries
+    """
+    stat = os.stat(path)
+    key = str(path)
+    cached = _parse_cache.get(key)
+
+    if cached is not None:
+        size, mtime_ns, offset, entries = cached
+        if size == stat.st_size and mtime_ns == stat.st_mtime_ns:
+            return entries
+        if stat.st_size > size:
+            # Append-only growth: decode just the new bytes and build a new
+            # list so previously returned lists are never mutated
+            new_entries, new_offset = _parse_entries_from(path, offset)
+            entries = entries + new_entries
+            _parse_cache[key] = (stat.st_size, stat.st_mtime_ns, new_offset, entries)
+            return entries
+
+    # First sight, truncation, or in-place rewrite: full parse
+    entries, offset = _parse_entries_from(path, 0)
+    _parse_cache[key] = (stat.st_size, stat.st_mtime_ns, offset, entries)
     return entries
 
 
+def parse_transcripts(
+    paths: Iterable[Path], workers: int | None = None
+) -> list[list[TranscriptEntry]]:
+    """Parse several transcript files in parallel.
+
+    Parsing is pure CPU (JSON decoding), so files are fanned out across a
+    process pool; a single file, where pool startup and entry pickling
+    would dominate, is parsed inline.
+
+    Args:
+        paths: Transcript file paths
+        workers: Maximum worker processes (defaults to the executor's choice)
+
+    Returns:
+        One entry list per path, in input order
+    """
+    paths = list(paths)
+    if len(paths) <= 1:
+        return [parse_transcript(path) for path in paths]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_transcript, paths))
+
+
 def extract_tool_calls(
-    transcript: list[TranscriptEntry],
+    transcript: Iterable[TranscriptEntry],
 ) -> list[tuple[ToolUse, ToolResult | None, bool]]:
     """Extract tool use/result pairs from a transcript with entry boundaries.
 
@@ -222,25 +474,30 @@ def extract_tool_calls(
     Returns:
         List of (tool_use, tool_result, is_new_entry) tuples
     """
-    # Build a map of tool_use_id -> ToolResult
+    # Single pass over the content blocks: collect results and uses together,
+    # then pair at the end (results arrive in later entries than their uses,
+    # so pairing has to wait until the whole transcript has been seen)
     results_by_id: dict[str, ToolResult] = {}
+    uses: list[tuple[ToolUse, bool]] = []
+    append_use = uses.append
     for entry in transcript:
-        for result in entry.tool_results:
-            results_by_id[result.tool_use_id] = result
-
-    # Collect all tool uses with their results and entry boundary markers
-    pairs: list[tuple[ToolUse, ToolResult | None, bool]] = []
-    for entry in transcript:
-        tool_uses = entry.tool_uses
-        for i, tool_use in enumerate(tool_uses):
-            result = results_by_id.get(tool_use.id)
-            is_new_entry = i == 0  # First tool call in this entry
-            pairs.append((tool_use, result, is_new_entry))
-
-    return pairs
-
-
-def get_project_directory(transcript: list[TranscriptEntry]) -> str | None:
+        is_new_entry = True  # True for the first tool call in this entry
+        for block in entry.content:
+            block_type = block.type
+            if block_type == "tool_use":
+                append_use((block.tool_use, is_new_entry))
+                is_new_entry = False
+            elif block_type == "tool_result":
+                result = block.tool_result
+                results_by_id[result.tool_use_id] = result
+
+    lookup = results_by_id.get
+    return [
+        (tool_use, lookup(tool_use.id), is_new_entry) for tool_use, is_new_entry in uses
+    ]
+
+
+def get_project_directory(transcript: Iterable[TranscriptEntry]) -> str | None:
     """Extract the original project directory from transcript.
 
     Looks for the 'cwd' field in transcript entries which indicates
@@ -253,17 +510,17 @@ def get_project_directory(transcript: list[TranscriptEntry]) -> str | None:
         The original project directory path, or None if not found
     """
     for entry in transcript:
-        if cwd := entry.raw.get("cwd"):
+        if cwd := entry.cwd:
             return cwd
     return None
 
 
-def filter_by_role(transcript: list[TranscriptEntry], role: str) -> list[TranscriptEntry]:
+def filter_by_role(transcript: Iterable[TranscriptEntry], role: str) -> list[TranscriptEntry]:
     """Filter transcript entries by role (user, assistant, system)."""
     return [e for e in transcript if e.role == role]
 
 
-def get_conversation_turns(transcript: list[TranscriptEntry]) -> list[tuple[TranscriptEntry, list[TranscriptEntry]]]:
+def get_conversation_turns(transcript: Iterable[TranscriptEntry]) -> list[tuple[TranscriptEntry, list[TranscriptEntry]]]:
     """Group transcript into conversation turns.
 
     Each turn is (user_entry, [assistant_entries]).
@@ -274,24 +531,30 @@ def get_conversation_turns(transcript: list[TranscriptEntry]) -> list[tuple[Tran
     turns: list[tuple[TranscriptEntry, list[TranscriptEntry]]] = []
     current_user: TranscriptEntry | None = None
     current_assistant: list[TranscriptEntry] = []
+    append_turn = turns.append
+    append_assistant = current_assistant.append
 
     for entry in transcript:
-        if entry.role == "user" and entry.type == "user":
-            # Check if this is a tool result (still part of assistant turn)
-            if entry.tool_results:
-                current_assistant.append(entry)
+        role = entry.role
+        if role == "user" and entry.type == "user":
+            # A user entry carrying tool results is still part of the
+            # assistant turn; scan the blocks directly instead of building
+            # the tool_results list just to test emptiness
+            if any(block.data.get("type") == "tool_result" for block in entry.content):
+                append_assistant(entry)
                 continue
 
             # New user turn
             if current_user is not None:
-                turns.append((current_user, current_assistant))
+                append_turn((current_user, current_assistant))
             current_user = entry
             current_assistant = []
-        elif entry.role == "assistant":
-            current_assistant.append(entry)
+            append_assistant = current_assistant.append
+        elif role == "assistant":
+            append_assistant(entry)
 
     # Add final turn
     if current_user is not None:
-        turns.append((current_user, current_assistant))
+        append_turn((current_user, current_assistant))
 
     return turns
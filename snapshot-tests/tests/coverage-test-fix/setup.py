@@ -70,12 +70,17 @@ requires-python = ">=3.11"
 pythonpath = ["."]
 ''')
 
-    # Initialize git repo (no origin)
-    subprocess.run(["git", "init", "--quiet"], check=True)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], check=True)
-    subprocess.run(["git", "config", "user.name", "Test User"], check=True)
-    subprocess.run(["git", "add", "-A"], check=True)
-    subprocess.run(["git", "commit", "-m", "Initial commit", "--quiet"], check=True)
+    # Initialize git repo (no origin) - one shell invocation instead of five
+    # subprocess spawns
+    subprocess.run(
+        "git init --quiet"
+        " && git config user.email test@example.com"
+        " && git config user.name 'Test User'"
+        " && git add -A"
+        " && git commit -m 'Initial commit' --quiet",
+        shell=True,
+        check=True,
+    )
 
 
 if __name__ == "__main__":
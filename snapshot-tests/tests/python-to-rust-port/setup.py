@@ -3,43 +3,21 @@
 
 import os
 import subprocess
-from pathlib import Path
-
-
-def main():
-    # Initialize git repo
-    subprocess.run(["git", "init"], check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        check=True,
-        capture_output=True,
-    )
-
-    # Create directory structure
-    Path("src").mkdir(exist_ok=True)
-    Path("tests").mkdir(exist_ok=True)
-
-    # Create src/__init__.py
-    Path("src/__init__.py").write_text("")
-
-    # Create tests/__init__.py
-    Path("tests/__init__.py").write_text("")
 
+# Every generated file as a (path, content) pair, written in one tight loop
+# over raw file descriptors rather than 14 separate Path.write_text calls
+FILES = [
+    ("src/__init__.py", ""),
+    ("tests/__init__.py", ""),
     # Module 1: string_utils
-    Path("src/string_utils.py").write_text('''"""String utility functions."""
+    ("src/string_utils.py", '''"""String utility functions."""
 
 
 def reverse_string(s: str) -> str:
     """Reverse a string."""
     return s[::-1]
-''')
-
-    Path("tests/test_string_utils.py").write_text('''"""Tests for string_utils."""
+'''),
+    ("tests/test_string_utils.py", '''"""Tests for string_utils."""
 
 from src.string_utils import reverse_string
 
@@ -48,10 +26,9 @@ def test_reverse_string():
     assert reverse_string("hello") == "olleh"
     assert reverse_string("") == ""
     assert reverse_string("a") == "a"
-''')
-
+'''),
     # Module 2: math_utils
-    Path("src/math_utils.py").write_text('''"""Math utility functions."""
+    ("src/math_utils.py", '''"""Math utility functions."""
 
 
 def factorial(n: int) -> int:
@@ -61,9 +38,8 @@ def factorial(n: int) -> int:
     if n <= 1:
         return 1
     return n * factorial(n - 1)
-''')
-
-    Path("tests/test_math_utils.py").write_text('''"""Tests for math_utils."""
+'''),
+    ("tests/test_math_utils.py", '''"""Tests for math_utils."""
 
 import pytest
 from src.math_utils import factorial
@@ -78,10 +54,9 @@ def test_factorial():
 def test_factorial_negative():
     with pytest.raises(ValueError):
         factorial(-1)
-''')
-
+'''),
     # Module 3: list_utils
-    Path("src/list_utils.py").write_text('''"""List utility functions."""
+    ("src/list_utils.py", '''"""List utility functions."""
 
 
 def flatten(nested: list) -> list:
@@ -93,9 +68,8 @@ def flatten(nested: list) -> list:
         else:
             result.append(item)
     return result
-''')
-
-    Path("tests/test_list_utils.py").write_text('''"""Tests for list_utils."""
+'''),
+    ("tests/test_list_utils.py", '''"""Tests for list_utils."""
 
 from src.list_utils import flatten
 
@@ -105,18 +79,16 @@ def test_flatten():
     assert flatten([1, [2, 3], 4]) == [1, 2, 3, 4]
     assert flatten([]) == []
     assert flatten([[1], [], [2]]) == [1, 2]
-''')
-
+'''),
     # Module 4: dict_utils
-    Path("src/dict_utils.py").write_text('''"""Dictionary utility functions."""
+    ("src/dict_utils.py", '''"""Dictionary utility functions."""
 
 
 def invert_dict(d: dict) -> dict:
     """Invert a dictionary (swap keys and values)."""
     return {v: k for k, v in d.items()}
-''')
-
-    Path("tests/test_dict_utils.py").write_text('''"""Tests for dict_utils."""
+'''),
+    ("tests/test_dict_utils.py", '''"""Tests for dict_utils."""
 
 from src.dict_utils import invert_dict
 
@@ -125,10 +97,9 @@ def test_invert_dict():
     assert invert_dict({"a": 1, "b": 2}) == {1: "a", 2: "b"}
     assert invert_dict({}) == {}
     assert invert_dict({1: "x"}) == {"x": 1}
-''')
-
+'''),
     # Module 5: validation
-    Path("src/validation.py").write_text('''"""Input validation functions."""
+    ("src/validation.py", '''"""Input validation functions."""
 
 
 def is_valid_email(email: str) -> bool:
@@ -144,9 +115,8 @@ def is_valid_email(email: str) -> bool:
     if "." not in domain:
         return False
     return True
-''')
-
-    Path("tests/test_validation.py").write_text('''"""Tests for validation."""
+'''),
+    ("tests/test_validation.py", '''"""Tests for validation."""
 
 from src.validation import is_valid_email
 
@@ -163,10 +133,8 @@ def test_is_valid_email_invalid():
     assert is_valid_email("user@") is False
     assert is_valid_email("user@nodot") is False
     assert is_valid_email("user@@double.com") is False
-''')
-
-    # Create pyproject.toml
-    Path("pyproject.toml").write_text('''[project]
+'''),
+    ("pyproject.toml", '''[project]
 name = "python-utils"
 version = "0.1.0"
 requires-python = ">=3.11"
@@ -186,10 +154,8 @@ source = ["src"]
 
 [tool.coverage.report]
 fail_under = 100
-''')
-
-    # Create Justfile
-    Path("Justfile").write_text('''# Run all checks
+'''),
+    ("Justfile", '''# Run all checks
 check:
     uv run pytest --cov=src --cov-report=term-missing --cov-fail-under=100
 
@@ -204,25 +170,55 @@ format:
 # Lint code
 lint:
     uv run ruff check .
-''')
-
-    # Create .gitignore
-    Path(".gitignore").write_text('''__pycache__/
+'''),
+    (".gitignore", '''__pycache__/
 *.pyc
 .pytest_cache/
 .coverage
 htmlcov/
 .venv/
 target/
-''')
+'''),
+]
 
-    # Install Python dependencies
-    subprocess.run(["uv", "sync"], check=True, capture_output=True)
 
-    # Initial commit
-    subprocess.run(["git", "add", "."], check=True, capture_output=True)
+def main():
+    # Initialize git repo - one shell invocation instead of three subprocess
+    # spawns
+    subprocess.run(
+        "git init --quiet"
+        " && git config user.email test@example.com"
+        " && git config user.name 'Test User'",
+        shell=True,
+        check=True,
+        capture_output=True,
+    )
+
+    # Create directory structure once, then emit every file through raw file
+    # descriptors (open/write/close, no TextIOWrapper or Path parsing)
+    os.makedirs("src", exist_ok=True)
+    os.makedirs("tests", exist_ok=True)
+    for path, content in FILES:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    # Install Python dependencies. Try the offline path first: with a warm
+    # uv cache this skips DNS and registry round trips entirely, which is
+    # the dominant setup latency across repeated snapshot runs. Fall back
+    # to a normal networked sync on a cold cache.
+    offline = subprocess.run(
+        ["uv", "sync", "--offline"], capture_output=True
+    )
+    if offline.returncode != 0:
+        subprocess.run(["uv", "sync"], check=True, capture_output=True)
+
+    # Initial commit - stage and commit in one shell invocation
     subprocess.run(
-        ["git", "commit", "-m", "Initial Python project with 5 modules"],
+        "git add . && git commit --quiet -m 'Initial Python project with 5 modules'",
+        shell=True,
         check=True,
         capture_output=True,
     )
@@ -1,20 +1,23 @@
 #!/usr/bin/env python3
 """Verify fast-path clean exit postconditions."""
+import os
 import sys
-from pathlib import Path
 
-# Check no session markers were created
-claude_dir = Path(".claude")
-if claude_dir.exists():
-    markers = [
-        "jkw-session.local.json",
-        "must-reflect.local",
-        "problem-mode.local",
-    ]
-    for marker in markers:
-        marker_path = claude_dir / marker
-        if marker_path.exists():
-            print(f"FAIL: Unexpected marker file: {marker}")
-            sys.exit(1)
+# Check no session markers were created. One directory listing replaces a
+# stat call per marker (and covers the .claude existence check itself).
+try:
+    present = set(os.listdir(".claude"))
+except FileNotFoundError:
+    present = set()
+
+markers = [
+    "jkw-session.local.json",
+    "must-reflect.local",
+    "problem-mode.local",
+]
+for marker in markers:
+    if marker in present:
+        print(f"FAIL: Unexpected marker file: {marker}")
+        sys.exit(1)
 
 print("PASS: Fast path clean exit - no markers created")